@@ -0,0 +1,703 @@
+"""ReviewScope web app.
+
+Flask front-end that kicks off Amazon scraping + analysis jobs, tracks
+their progress, and serves the resulting dashboards, web insights and
+product comparisons.
+"""
+
+import csv
+import gzip
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+from cachetools import TTLCache
+from flask import (Flask, Response, jsonify, redirect, render_template,
+                   request, send_from_directory, stream_with_context, url_for)
+from flask.json.provider import JSONProvider
+from werkzeug.utils import secure_filename
+
+from modules.analyzer import AmazonAnalyzer
+from modules.dashboard import generate_dashboard_data
+from modules.scraper import AmazonScraper
+from modules.serper_api import SerperAPI, format_insights
+
+try:
+    from celery import Celery
+except ImportError:  # Celery is optional; threads remain the fallback.
+    Celery = None
+
+try:
+    import redis
+except ImportError:  # Redis is optional; the in-process dict is the fallback.
+    redis = None
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson so jsonify skips stdlib encoding."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+Flask.json_provider_class = ORJSONProvider
+
+app = Flask(__name__)
+# Anchored to the app directory so jobs, downloads and the analyzer
+# subprocess work no matter where the server was launched from.
+_BASE_DIR = Path(__file__).resolve().parent
+app.config['UPLOAD_FOLDER'] = str(_BASE_DIR / 'data' / 'raw')
+app.config['RESULTS_FOLDER'] = str(_BASE_DIR / 'data' / 'processed')
+# Let a fronting nginx/Apache serve downloads via sendfile(2) instead of
+# copying bytes through the WSGI layer.
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+
+# Skip template stat/reload checks and dict-key sorting outside debug;
+# both are per-request costs that show up under job-status polling.
+app.config.update(TEMPLATES_AUTO_RELOAD=app.debug, JSON_SORT_KEYS=False)
+app.jinja_env.cache_size = 400
+app.jinja_env.auto_reload = app.debug
+
+UPLOADS = Path(app.config['UPLOAD_FOLDER'])
+RESULTS = Path(app.config['RESULTS_FOLDER'])
+UPLOADS.mkdir(parents=True, exist_ok=True)
+RESULTS.mkdir(parents=True, exist_ok=True)
+
+# Celery is used when a broker is configured; otherwise jobs run on
+# daemon threads and state lives in the in-process registry below.
+BROKER_URL = os.environ.get('CELERY_BROKER_URL')
+if Celery is not None and BROKER_URL:
+    celery = Celery('reviewscope', broker=BROKER_URL,
+                    backend=os.environ.get('CELERY_RESULT_BACKEND',
+                                           BROKER_URL))
+else:
+    celery = None
+
+# Job state lives in a Redis hash per job when REDIS_URL is set, making
+# reads/writes lock-free and cross-process; otherwise it falls back to the
+# in-process dict guarded by jobs_lock.
+REDIS_URL = os.environ.get('REDIS_URL')
+if redis is not None and REDIS_URL:
+    job_store = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+else:
+    job_store = None
+
+# Size-capped with a 24h TTL so stale jobs evict automatically instead of
+# growing process memory for its lifetime; evicted jobs' result files stay
+# on disk and load on demand.
+active_jobs = TTLCache(maxsize=512, ttl=86400)
+jobs_lock = threading.Lock()
+
+# Hoisted string-op constants for request-hot paths.
+_SLUG = str.maketrans({' ': '_'})
+_CSV_EXT = '.csv'
+
+# Fields that must come back as numbers from the (string-typed) Redis hash.
+_JOB_INT_FIELDS = ('progress',)
+_JOB_FLOAT_FIELDS = ('started_at',)
+
+
+def _job_key(job_id):
+    return f'job:{job_id}'
+
+
+def data_path(job_id):
+    """Path of the scraped CSV for a job."""
+    return UPLOADS / f"{job_id}_data.csv"
+
+
+def result_path(job_id):
+    """Path of the analysis results JSON for a job."""
+    return RESULTS / f"{job_id}_analysis.json"
+
+
+def _comparison_path(product1, product2):
+    """Canonical cache path for a two-product comparison."""
+    return RESULTS / (f"comparison_{product1.translate(_SLUG)}"
+                      f"_{product2.translate(_SLUG)}.json")
+
+
+def _cache_read(path):
+    """Read a cache JSON written by _cache_write; handles legacy plain files."""
+    gz = f"{path}.gz"
+    if os.path.exists(gz):
+        with gzip.open(gz, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _cache_exists(path):
+    return os.path.exists(f"{path}.gz") or os.path.exists(path)
+
+
+def _cache_write(path, obj):
+    """Persist a cache dict as gzipped JSON, atomically.
+
+    level 3 gets most of the ratio on repetitive JSON for minimal CPU,
+    so hot readers pull far fewer bytes off disk. Writing to a temp file
+    and os.replace-ing it in means concurrent readers always see either
+    the old or the new complete file, never a partial write.
+    """
+    tmp = f"{path}.gz.tmp"
+    with gzip.open(tmp, 'wb', compresslevel=3) as f:
+        f.write(orjson.dumps(obj))
+    os.replace(tmp, f"{path}.gz")
+
+
+def job_get(job_id):
+    """Return a job's state dict, or None if it is unknown."""
+    if job_store is not None:
+        job = job_store.hgetall(_job_key(job_id))
+        if not job:
+            return None
+        for field in _JOB_INT_FIELDS:
+            if field in job:
+                job[field] = int(job[field])
+        for field in _JOB_FLOAT_FIELDS:
+            if field in job:
+                job[field] = float(job[field])
+        return job
+    with jobs_lock:
+        job = active_jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+
+# Per-job events that wake SSE streamers when state changes. Only effective
+# for same-process writers (the thread path); remote writers are covered by
+# the stream's wait timeout. Same bounding policy as active_jobs.
+_progress_events = TTLCache(maxsize=512, ttl=86400)
+
+
+def _progress_event(job_id):
+    with jobs_lock:
+        return _progress_events.setdefault(job_id, threading.Event())
+
+
+def job_set(job_id, /, **fields):
+    """Create or update a job's state.
+
+    ``job_id`` is positional-only so completion payloads that carry a
+    ``job_id`` field can be splatted in without colliding; the stored
+    dict always includes it either way.
+    """
+    fields.setdefault('job_id', job_id)
+    if job_store is not None:
+        job_store.hset(_job_key(job_id), mapping=fields)
+    else:
+        with jobs_lock:
+            active_jobs.setdefault(job_id, {}).update(fields)
+    # TTLCache lookups can evict expired entries, so they need the same
+    # lock as the subscribers that insert events.
+    with jobs_lock:
+        event = _progress_events.get(job_id)
+    if event is not None:
+        event.set()
+
+
+def job_update_existing(job_id, **fields):
+    """Update a job only if it is still tracked; returns False otherwise.
+
+    Single lock acquisition (or Redis round-trip pair) instead of a
+    separate existence check followed by a write.
+    """
+    if job_store is not None:
+        if not job_store.exists(_job_key(job_id)):
+            return False
+        job_store.hset(_job_key(job_id), mapping=fields)
+    else:
+        with jobs_lock:
+            job = active_jobs.get(job_id)
+            if job is None:
+                return False
+            job.update(fields)
+    with jobs_lock:
+        event = _progress_events.get(job_id)
+    if event is not None:
+        event.set()
+    return True
+
+
+def jobs_clear():
+    """Forget every tracked job; returns how many were dropped."""
+    if job_store is not None:
+        keys = job_store.keys(_job_key('*'))
+        if keys:
+            job_store.delete(*keys)
+        return len(keys)
+    with jobs_lock:
+        cleared = len(active_jobs)
+        active_jobs.clear()
+    return cleared
+
+
+def update_progress(job_id, progress, status=None):
+    """Record scraper/analyzer progress for a running job."""
+    if status:
+        job_set(job_id, progress=progress, status=status)
+    else:
+        job_set(job_id, progress=progress)
+
+
+def _run_analyzer(input_file, output_file, report):
+    """Run the analyzer phase, preferring a subprocess.
+
+    Keeps the CPU-bound analysis out of this process so it cannot hold
+    the GIL against request handlers; progress comes back over the
+    child's PROGRESS lines. Falls back to the in-process analyzer if the
+    interpreter cannot be spawned.
+    """
+    cmd = [sys.executable, '-m', 'modules.analyzer',
+           os.path.abspath(input_file), os.path.abspath(output_file)]
+    try:
+        # stderr is merged into stdout: draining one pipe to EOF while
+        # the child blocks writing a long traceback to another would
+        # deadlock once the stderr pipe buffer fills.
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+            cwd=_BASE_DIR)
+    except OSError:
+        AmazonAnalyzer().analyze_file(input_file, output_file,
+                                      progress_callback=report)
+        return
+    detail = None
+    with proc.stdout:
+        for line in proc.stdout:
+            if line.startswith('PROGRESS '):
+                try:
+                    report(int(line.split()[1]))
+                except (IndexError, ValueError):
+                    pass
+            elif line.strip():
+                # The last diagnostic line is the exception message;
+                # surface it so failed jobs report the actual cause.
+                detail = line.strip()
+    if proc.wait() != 0:
+        raise RuntimeError(
+            f"analyzer subprocess failed: {detail or 'no stderr output'}")
+
+
+def _execute_scraper_job(job_id, search_term, max_pages, report):
+    """Scrape then analyze, reporting progress through ``report``.
+
+    ``report(progress, status=None)`` is backend-agnostic: the thread
+    path writes into active_jobs, the Celery path into task state.
+    Returns the completion payload for the job.
+    """
+    output_file = data_path(job_id)
+    scraper = AmazonScraper()
+    try:
+        scraper.search_amazon(
+            search_term, max_pages=max_pages, output_file=output_file,
+            progress_callback=lambda p: report(p // 2))
+    finally:
+        # Driver shutdown moved out of search_amazon so long-lived
+        # scrapers can reuse Chrome; per-job instances release it here.
+        scraper.close()
+
+    report(50, status='analyzing')
+
+    _run_analyzer(output_file, result_path(job_id),
+                  lambda p: report(50 + p // 2))
+
+    # Derived strings are resolved once here so request handlers can read
+    # them off the job dict instead of re-formatting per request.
+    slug = search_term.translate(_SLUG)
+    return {
+        'job_id': job_id,
+        'search_term': search_term,
+        'status': 'completed',
+        'progress': 100,
+        'dashboard_url': f"/dashboard/{job_id}",
+        'data_file': str(data_path(job_id)),
+        'result_file': str(result_path(job_id)),
+        'data_download_name': f"amazon_products_{slug}.csv",
+        'analysis_download_name': f"amazon_analysis_{slug}.json",
+    }
+
+
+def run_scraper_job(job_id, search_term, max_pages):
+    """Thread entry point: scrape, then analyze, updating job state."""
+    if not job_update_existing(job_id, status='scraping'):
+        return
+
+    try:
+        completed = _execute_scraper_job(
+            job_id, search_term, max_pages,
+            lambda p, status=None: update_progress(job_id, p, status))
+        job_set(job_id, **completed)
+    except Exception as exc:
+        job_set(job_id, status='failed', error=str(exc))
+
+
+if celery is not None:
+    @celery.task(bind=True, name='reviewscope.run_scraper_job')
+    def run_scraper_task(self, search_term, max_pages):
+        """Celery entry point; the task id doubles as the job id."""
+        job_id = self.request.id
+
+        def report(progress, status=None):
+            meta = {'job_id': job_id, 'search_term': search_term,
+                    'progress': progress, 'status': status or 'scraping'}
+            self.update_state(state='PROGRESS', meta=meta)
+
+        return _execute_scraper_job(job_id, search_term, max_pages, report)
+
+
+def run_analysis_job(job_id, data_file):
+    """Worker entry point for re-analyzing an existing CSV."""
+    if not job_update_existing(job_id, status='analyzing'):
+        return
+
+    try:
+        _run_analyzer(data_file, result_path(job_id),
+                      lambda p: update_progress(job_id, p))
+
+        slug = (job_get(job_id) or {}).get('search_term', job_id)
+        slug = slug.translate(_SLUG)
+        job_set(job_id, status='completed', progress=100,
+                dashboard_url=f"/dashboard/{job_id}",
+                data_file=str(data_file), result_file=str(result_path(job_id)),
+                data_download_name=f"amazon_products_{slug}.csv",
+                analysis_download_name=f"amazon_analysis_{slug}.json")
+    except Exception as exc:
+        job_set(job_id, status='failed', error=str(exc))
+
+
+@app.route('/')
+def index():
+    return render_template('index.html')
+
+
+@app.route('/search', methods=['POST'])
+def search():
+    """Start a scrape+analyze job for a search term."""
+    search_term = request.form.get('search_term', '').strip()
+    if not search_term:
+        return redirect(url_for('index'))
+    max_pages = int(request.form.get('max_pages', 3))
+
+    job_id = f"{search_term.translate(_SLUG)}_{uuid.uuid4().hex[:8]}"
+    if celery is not None:
+        run_scraper_task.apply_async(args=(search_term, max_pages),
+                                     task_id=job_id)
+    else:
+        job_set(job_id, search_term=search_term,
+                status='queued', progress=0, started_at=time.time())
+        thread = threading.Thread(target=run_scraper_job,
+                                  args=(job_id, search_term, max_pages),
+                                  daemon=True)
+        thread.start()
+    return render_template('results.html', job_id=job_id,
+                           search_term=search_term)
+
+
+def _job_state(job_id):
+    """Current job state dict for the API, or None if unknown."""
+    if celery is not None:
+        result = celery.AsyncResult(job_id)
+        if result.state == 'PROGRESS':
+            return result.info
+        if result.state == 'SUCCESS':
+            return result.result
+        if result.state == 'FAILURE':
+            return {'job_id': job_id, 'status': 'failed',
+                    'error': str(result.result)}
+        # PENDING can't distinguish "queued" from "not a Celery task":
+        # re-analysis jobs run on threads even with a broker configured,
+        # so check the job store before assuming queued.
+        job = job_get(job_id)
+        if job is not None:
+            return job
+        return {'job_id': job_id, 'status': 'queued', 'progress': 0}
+    return job_get(job_id)
+
+
+@app.route('/api/job-status/<job_id>')
+def get_job_status(job_id):
+    """One-shot job state; fallback for clients without EventSource."""
+    job = _job_state(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found. '
+                                 'The server may have restarted.'}), 404
+    return jsonify(job)
+
+
+@app.route('/api/job-stream/<job_id>')
+def stream_job_status(job_id):
+    """Push job state over Server-Sent Events whenever it changes."""
+    # Same-process writers set the event; cross-process writers (Celery or
+    # a Redis-backed store) are picked up by the shorter wait timeout.
+    wait_timeout = 30.0 if celery is None and job_store is None else 2.0
+
+    def stream():
+        event = _progress_event(job_id)
+        while True:
+            # Clear before reading: a write landing after the read but
+            # before a later clear would be lost and stall the stream
+            # for a full wait timeout.
+            event.clear()
+            job = _job_state(job_id)
+            if job is None:
+                yield b'data: {"error": "Job not found"}\n\n'
+                return
+            yield b'data: ' + orjson.dumps(job) + b'\n\n'
+            if job.get('status') in ('completed', 'failed'):
+                return
+            event.wait(timeout=wait_timeout)
+
+    return Response(stream_with_context(stream()),
+                    mimetype='text/event-stream')
+
+
+@app.route('/api/clear-jobs', methods=['POST'])
+def clear_jobs():
+    """Drop all tracked jobs (result files stay on disk)."""
+    return jsonify({'cleared': jobs_clear()})
+
+
+@lru_cache(maxsize=128)
+def _load_analysis(job_id, _mtime):
+    """Parsed analysis results, memoized per (job_id, file mtime)."""
+    return orjson.loads(result_path(job_id).read_bytes())
+
+
+@lru_cache(maxsize=32)
+def _dashboard_cached(job_id, _mtime):
+    """Dashboard payload, memoized in-process and cached on disk."""
+    cache_file = RESULTS / f"{job_id}_dashboard.json"
+    if _cache_exists(cache_file):
+        return _cache_read(cache_file)
+    dashboard_data = generate_dashboard_data(_load_analysis(job_id, _mtime))
+    _cache_write(cache_file, dashboard_data)
+    return dashboard_data
+
+
+def _load_dashboard_data(job_id):
+    """Dashboard payload for a job, or None if it has no analysis.
+
+    Analysis results are immutable once a job completes, so the rendered
+    dashboard dict is memoized on (job_id, mtime) and persisted to
+    {job_id}_dashboard.json; repeat page views touch neither the analysis
+    JSON nor the chart builders.
+    """
+    result_file = result_path(job_id)
+    if not result_file.exists():
+        return None
+    return _dashboard_cached(job_id, os.path.getmtime(result_file))
+
+
+@app.route('/dashboard/<job_id>')
+def dashboard(job_id):
+    """Render the analysis dashboard for a completed job."""
+    dashboard_data = _load_dashboard_data(job_id)
+    if dashboard_data is None:
+        return render_template('error.html',
+                               message='Analysis not found for this job.'), 404
+    return render_template('dashboard.html', job_id=job_id,
+                           dashboard_data=dashboard_data)
+
+
+@app.route('/api/analysis/<job_id>')
+def get_analysis_data(job_id):
+    """Raw analysis results as JSON."""
+    result_file = result_path(job_id)
+    try:
+        stat = os.stat(result_file)
+    except OSError:
+        return jsonify({'error': 'Analysis not found'}), 404
+
+    # The file never changes after completion, so repeat polls can be
+    # answered with a stat + 304 instead of a full parse+encode.
+    etag = f'"{int(stat.st_mtime)}-{stat.st_size}"'
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    resp = jsonify(_load_analysis(job_id, stat.st_mtime))
+    resp.headers['ETag'] = etag
+    resp.headers['Cache-Control'] = 'private, max-age=60'
+    return resp
+
+
+@app.route('/api/data/<job_id>')
+def get_raw_data(job_id):
+    """Raw scraped rows as JSON records, streamed straight off the CSV."""
+    data_file = data_path(job_id)
+    try:
+        stat = os.stat(data_file)
+    except OSError:
+        return jsonify({'error': 'Data not found'}), 404
+
+    etag = f'"{int(stat.st_mtime)}-{stat.st_size}"'
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    def generate():
+        with open(data_file, newline='', encoding='utf-8') as f:
+            yield b'['
+            for i, row in enumerate(csv.DictReader(f)):
+                if i:
+                    yield b','
+                yield orjson.dumps(row)
+            yield b']'
+
+    resp = Response(stream_with_context(generate()),
+                    mimetype='application/json')
+    resp.headers['ETag'] = etag
+    resp.headers['Cache-Control'] = 'private, max-age=60'
+    return resp
+
+
+@app.route('/download/data/<job_id>')
+def download_raw_data(job_id):
+    """Download the scraped CSV."""
+    job = job_get(job_id) or {}
+    download_name = job.get('data_download_name')
+    if download_name is None:
+        search_term = job.get('search_term', job_id)
+        download_name = f"amazon_products_{search_term.translate(_SLUG)}.csv"
+    if not data_path(job_id).exists():
+        return jsonify({'error': 'Data not found'}), 404
+    return send_from_directory(
+        app.config['UPLOAD_FOLDER'], f"{job_id}_data.csv",
+        mimetype='text/csv', as_attachment=True, conditional=True,
+        download_name=download_name)
+
+
+@app.route('/download/analysis/<job_id>')
+def download_analysis(job_id):
+    """Download the analysis results JSON."""
+    job = job_get(job_id) or {}
+    download_name = job.get('analysis_download_name')
+    if download_name is None:
+        search_term = job.get('search_term', job_id)
+        download_name = f"amazon_analysis_{search_term.translate(_SLUG)}.json"
+    if not result_path(job_id).exists():
+        return jsonify({'error': 'Analysis not found'}), 404
+    return send_from_directory(
+        app.config['RESULTS_FOLDER'], f"{job_id}_analysis.json",
+        mimetype='application/json', as_attachment=True, conditional=True,
+        download_name=download_name)
+
+
+@app.route('/web-insights/<job_id>')
+def web_insights(job_id):
+    """Blend the dashboard with live web sentiment from Serper."""
+    dashboard_data = _load_dashboard_data(job_id)
+    if dashboard_data is None:
+        return render_template('error.html',
+                               message='Analysis not found for this job.'), 404
+
+    job = job_get(job_id)
+    if job:
+        search_term = job['search_term']
+    else:
+        search_term = job_id.rsplit('_', 1)[0].replace('_', ' ')
+
+    cache_file = RESULTS / f"{job_id}_web_insights.json"
+    if _cache_exists(cache_file):
+        insights = _cache_read(cache_file)
+    else:
+        with SerperAPI(os.environ.get('SERPER_API_KEY', '')) as serper_api:
+            insights = format_insights(
+                serper_api.get_product_insights(search_term))
+        _cache_write(cache_file, insights)
+
+    return render_template('insights.html', job_id=job_id,
+                           search_term=search_term, insights=insights,
+                           dashboard_data=dashboard_data)
+
+
+@app.route('/compare', methods=['POST'])
+def compare_products():
+    """Run a two-product web comparison and cache the result."""
+    product1 = request.form.get('product1', '').strip()
+    product2 = request.form.get('product2', '').strip()
+    if not product1 or not product2:
+        return redirect(url_for('index'))
+
+    cache_file = _comparison_path(product1, product2)
+    if not _cache_exists(cache_file):
+        with SerperAPI(os.environ.get('SERPER_API_KEY', '')) as serper_api:
+            comparison = serper_api.compare_products(product1, product2)
+        _cache_write(cache_file, comparison)
+
+    return redirect(url_for('view_comparison', product1=product1,
+                            product2=product2))
+
+
+@app.route('/comparison/<product1>/<product2>')
+def view_comparison(product1, product2):
+    """Render a cached comparison, regenerating it if missing."""
+    cache_file = _comparison_path(product1, product2)
+    if _cache_exists(cache_file):
+        comparison = _cache_read(cache_file)
+    else:
+        with SerperAPI(os.environ.get('SERPER_API_KEY', '')) as serper_api:
+            comparison = serper_api.compare_products(product1, product2)
+        _cache_write(cache_file, comparison)
+
+    return render_template('comparison.html', product1=product1,
+                           product2=product2, comparison=comparison)
+
+
+@lru_cache(maxsize=1)
+def _list_csvs(_mtime):
+    """Scraped CSV names, memoized on the directory's mtime."""
+    return tuple(sorted(entry.name for entry in os.scandir(UPLOADS)
+                        if entry.name.lower().endswith(_CSV_EXT)))
+
+
+@app.route('/existing-data')
+def existing_data():
+    """List previously scraped CSVs available for re-analysis."""
+    # One stat per request; the scan only reruns when the folder changes.
+    csv_files = _list_csvs(os.stat(UPLOADS).st_mtime)
+    return render_template('existing_data.html', csv_files=csv_files)
+
+
+@app.route('/analyze-csv', methods=['POST'])
+def analyze_csv():
+    """Re-run analysis over a CSV that is already on disk."""
+    filename = request.form.get('filename', '')
+    # Reject anything secure_filename would rewrite (path separators,
+    # leading dots, ...) rather than silently resolving it to another
+    # file; legitimate names come straight from /existing-data.
+    if (not filename.lower().endswith(_CSV_EXT)
+            or filename != secure_filename(filename)):
+        return redirect(url_for('existing_data'))
+
+    data_file = UPLOADS / filename
+    if not data_file.exists():
+        return redirect(url_for('existing_data'))
+
+    if filename.endswith('_data.csv'):
+        job_id = filename[:-len('_data.csv')]
+    else:
+        job_id = filename[:-len(_CSV_EXT)]
+    search_term = ' '.join(job_id.split('_')[:-1]) or job_id
+
+    job_set(job_id, search_term=search_term,
+            status='queued', progress=0, started_at=time.time())
+
+    thread = threading.Thread(target=run_analysis_job,
+                              args=(job_id, data_file), daemon=True)
+    thread.start()
+    return render_template('results.html', job_id=job_id,
+                           search_term=search_term)
+
+
+if __name__ == '__main__' and os.environ.get('DEV'):
+    # Development only. In production run under gunicorn's gevent workers
+    # (see README) so status polls and downloads don't serialize through
+    # a single-threaded dev server.
+    app.run(debug=True, host='0.0.0.0', port=8080)
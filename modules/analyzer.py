@@ -0,0 +1,287 @@
+"""Statistical analysis of scraped Amazon product data.
+
+Takes the raw CSV written by the scraper, cleans the price/rating/review
+columns into numeric form and produces the analysis dict that feeds the
+dashboard: summary stats, correlations, distributions and title/sentiment
+analysis.
+"""
+
+import os
+import re
+
+import numpy as np
+import orjson
+import pandas as pd
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; pandas' reader is the fallback.
+    pacsv = None
+
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:  # vaderSentiment is optional; TextBlob is the fallback.
+    SentimentIntensityAnalyzer = None
+    from textblob import TextBlob
+
+# The scraper writes a fixed schema; declaring it skips pandas' generic
+# type inference on ingest.
+CSV_DTYPES = {
+    'title': 'string',
+    'url': 'string',
+    'asin': 'string',
+    'price': 'string',
+    'rating': 'string',
+    'review_count': 'string',
+}
+
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,15}\b')
+
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'not', 'are', 'but', 'was', 'you', 'all',
+    'can', 'has', 'have', 'this', 'that', 'from', 'our', 'your', 'their',
+    'its', 'per', 'pack', 'set', 'new', 'one', 'two', 'inch', 'piece',
+})
+
+# VADER's analyzer is stateless after loading its lexicon, so one shared
+# instance serves every job.
+_SIA = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer else None
+
+
+def _bucket_counts(values, edges, labels):
+    """Histogram ``values`` over fixed buckets without pd.cut.
+
+    ``edges`` are the inner bucket boundaries (right-closed, matching
+    what ``pd.cut`` produced here); searchsorted + bincount avoids the
+    Categorical allocation entirely.
+    """
+    idx = np.searchsorted(edges, values, side='left')
+    counts = np.bincount(idx, minlength=len(labels))
+    return {label: int(count) for label, count in zip(labels, counts)}
+
+
+def _title_sentiments(titles):
+    """Polarity scores for an iterable of titles as a float32 ndarray."""
+    if _SIA is not None:
+        # Reusing one analyzer amortizes the lexicon load; no per-title
+        # POS tagging like TextBlob does.
+        scores = (_SIA.polarity_scores(t)['compound'] for t in titles)
+    else:
+        scores = (TextBlob(t).sentiment.polarity for t in titles)
+    return np.fromiter(scores, dtype=np.float32, count=len(titles))
+
+
+class AmazonAnalyzer:
+    """Turns a scraped product CSV into an analysis results dict."""
+
+    def analyze_file(self, input_file, output_file=None, progress_callback=None):
+        """Analyze ``input_file`` and optionally write results as JSON."""
+        if str(input_file).endswith('.parquet'):
+            df = pd.read_parquet(input_file, engine='pyarrow')
+        elif pacsv is not None:
+            # Arrow's reader parses multithreaded; downstream code is
+            # unaffected since the result is still a DataFrame.
+            df = pacsv.read_csv(input_file).to_pandas()
+        else:
+            try:
+                df = pd.read_csv(input_file, engine='c', dtype=CSV_DTYPES)
+            except ValueError:
+                # Re-analyzed CSVs may not match the scraper schema exactly.
+                df = pd.read_csv(input_file)
+        if progress_callback:
+            progress_callback(10)
+
+        df = self.clean_data(df)
+        if progress_callback:
+            progress_callback(40)
+
+        analysis_results = self.perform_analysis(df)
+        if progress_callback:
+            progress_callback(90)
+
+        if output_file:
+            # Write-to-temp + os.replace so dashboard reads never see a
+            # half-written results file during re-analysis.
+            tmp = f"{output_file}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(
+                    analysis_results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            os.replace(tmp, output_file)
+        if progress_callback:
+            progress_callback(100)
+        return analysis_results
+
+    def clean_data(self, df):
+        """Derive numeric ``*_clean`` columns from the scraped text fields.
+
+        Each column is cleaned in a single extract + to_numeric pass;
+        ``errors='coerce'`` absorbs malformed and missing values, so no
+        per-step replace/fillna round-trips are needed. The columns use
+        32-bit dtypes: prices, star ratings and review counts all fit,
+        and the perform_analysis reductions scan half the bytes.
+        """
+        df = df.copy()
+
+        if 'price' in df.columns:
+            df['price_clean'] = pd.to_numeric(
+                df['price'].astype(str)
+                .str.extract(r'([\d,.]+)', expand=False)
+                .str.replace(',', '', regex=False),
+                errors='coerce').fillna(0).astype(np.float32)
+        else:
+            df['price_clean'] = np.float32(0)
+
+        if 'rating' in df.columns:
+            df['rating_clean'] = pd.to_numeric(
+                df['rating'].astype(str)
+                .str.extract(r'(\d+(?:\.\d+)?)', expand=False),
+                errors='coerce').fillna(0).astype(np.float32)
+        else:
+            df['rating_clean'] = np.float32(0)
+
+        if 'review_count' in df.columns:
+            df['review_count_clean'] = pd.to_numeric(
+                df['review_count'].astype(str)
+                .str.extract(r'([\d,]+)', expand=False)
+                .str.replace(',', '', regex=False),
+                errors='coerce').fillna(0).astype(np.int32)
+        else:
+            df['review_count_clean'] = np.int32(0)
+
+        if 'title' in df.columns:
+            df['title'] = df['title'].fillna('Unknown Product')
+        else:
+            df['title'] = 'Unknown Product'
+        if pacsv is not None:
+            # Arrow-backed storage keeps titles in one contiguous UTF-8
+            # buffer, so the .str kernels in analyze_titles run in C
+            # instead of chasing per-row Python str pointers.
+            df['title'] = df['title'].astype('string[pyarrow]')
+
+        return df
+
+    def perform_analysis(self, df):
+        """Compute the full analysis dict for a cleaned DataFrame."""
+        # One fused agg pass over the three numeric columns instead of a
+        # separate column scan per statistic.
+        stats = df[['price_clean', 'rating_clean', 'review_count_clean']].agg(
+            ['min', 'max', 'mean', 'median', 'std', 'sum'])
+        # One corr() over all three columns instead of three pairwise
+        # 2x2 computations; the off-diagonals are the pairs we report.
+        cm = df[['price_clean', 'rating_clean',
+                 'review_count_clean']].corr().to_numpy()
+        results = {
+            'total_products': len(df),
+            'price_analysis': {
+                'min': float(stats.loc['min', 'price_clean']),
+                'max': float(stats.loc['max', 'price_clean']),
+                'mean': float(stats.loc['mean', 'price_clean']),
+                'median': float(stats.loc['median', 'price_clean']),
+                'std': float(stats.loc['std', 'price_clean']),
+            },
+            'rating_analysis': {
+                'min': float(stats.loc['min', 'rating_clean']),
+                'max': float(stats.loc['max', 'rating_clean']),
+                'mean': float(stats.loc['mean', 'rating_clean']),
+                'median': float(stats.loc['median', 'rating_clean']),
+                'std': float(stats.loc['std', 'rating_clean']),
+            },
+            'review_analysis': {
+                'min': int(stats.loc['min', 'review_count_clean']),
+                'max': int(stats.loc['max', 'review_count_clean']),
+                'mean': float(stats.loc['mean', 'review_count_clean']),
+                'median': float(stats.loc['median', 'review_count_clean']),
+                'total': int(stats.loc['sum', 'review_count_clean']),
+            },
+            'correlations': {
+                'price_vs_rating': float(cm[0, 1]),
+                'price_vs_reviews': float(cm[0, 2]),
+                'rating_vs_reviews': float(cm[1, 2]),
+            },
+            'price_ranges': self.get_price_ranges(df),
+            'rating_distribution': self.get_rating_distribution(df),
+            'review_distribution': self.get_review_distribution(df),
+            'title_analysis': self.analyze_titles(df),
+        }
+        return results
+
+    def get_price_ranges(self, df):
+        """Histogram of prices over fixed dollar buckets."""
+        edges = [25, 50, 100, 200, 500]
+        labels = ['$0-25', '$25-50', '$50-100', '$100-200', '$200-500', '$500+']
+        return _bucket_counts(df['price_clean'].to_numpy(), edges, labels)
+
+    def get_rating_distribution(self, df):
+        """Counts of ratings rounded to the nearest half star."""
+        arr = df['rating_clean'].to_numpy(dtype=np.float32)
+        rounded = np.where(np.isnan(arr), 0.0, np.round(arr * 2) * 0.5)
+        ratings, counts = np.unique(rounded, return_counts=True)
+        return {str(float(rating)): int(count)
+                for rating, count in zip(ratings, counts)}
+
+    def get_review_distribution(self, df):
+        """Histogram of review counts over order-of-magnitude buckets."""
+        edges = [10, 100, 1000, 10000]
+        labels = ['0-10', '10-100', '100-1K', '1K-10K', '10K+']
+        return _bucket_counts(df['review_count_clean'].to_numpy(), edges, labels)
+
+    def analyze_titles(self, df):
+        """Top words and sentiment polarity over the product titles."""
+        titles = df['title']
+        valid_titles = titles[titles.to_numpy() != 'Unknown Product']
+
+        # Tokenize and count through the vectorized .str kernels; only
+        # the stop-word filter and top-20 cut touch Python objects.
+        word_counts = (valid_titles.str.lower()
+                       .str.findall(_WORD_RE)
+                       .explode()
+                       .value_counts())
+        word_counts = word_counts[~word_counts.index.isin(STOP_WORDS)]
+        top_words = [(word, int(count))
+                     for word, count in word_counts.head(20).items()]
+
+        sentiments = _title_sentiments(valid_titles)
+        if len(sentiments):
+            avg_sentiment = float(sentiments.mean())
+            positive_count = int((sentiments > 0.2).sum())
+            negative_count = int((sentiments < -0.2).sum())
+            neutral_count = len(sentiments) - positive_count - negative_count
+        else:
+            avg_sentiment = 0.0
+            positive_count = neutral_count = negative_count = 0
+
+        return {
+            'top_words': [{'word': word, 'count': count}
+                          for word, count in top_words],
+            'avg_sentiment': round(avg_sentiment, 3),
+            'positive_count': positive_count,
+            'neutral_count': neutral_count,
+            'negative_count': negative_count,
+        }
+
+
+def main(argv=None):
+    """CLI entry point: ``python -m modules.analyzer <input_csv> <output_json>``.
+
+    Lets the web app (or any supervisor) run the CPU-bound analysis phase
+    in its own process. Emits ``PROGRESS <n>`` lines on stdout for
+    progress tracking.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Analyze a scraped Amazon product CSV.')
+    parser.add_argument('input_file')
+    parser.add_argument('output_file')
+    args = parser.parse_args(argv)
+
+    def report(progress):
+        print(f'PROGRESS {progress}', flush=True)
+
+    AmazonAnalyzer().analyze_file(args.input_file, args.output_file,
+                                  progress_callback=report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Plotly chart construction for the analysis dashboard."""
+
+from functools import lru_cache
+
+import numpy as np
+import orjson
+import plotly.graph_objects as go
+
+
+def _to_json(fig):
+    """Serialize a figure with orjson instead of fig.to_json()'s stdlib path."""
+    return orjson.dumps(
+        fig.to_plotly_json(),
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def generate_dashboard_data(analysis_results):
+    """Build the summary block and JSON chart payloads for the dashboard.
+
+    Payloads are deterministic in the analysis dict, so they are
+    memoized on its serialized form — re-rendering a dashboard (or the
+    same results under a different job) skips figure construction.
+    """
+    key = orjson.dumps(analysis_results, option=orjson.OPT_SORT_KEYS)
+    return _build_dashboard(key)
+
+
+@lru_cache(maxsize=32)
+def _build_dashboard(results_blob):
+    analysis_results = orjson.loads(results_blob)
+    title_analysis = analysis_results.get('title_analysis', {})
+    return {
+        'summary': {
+            'total_products': analysis_results.get('total_products', 0),
+            'avg_price': round(
+                analysis_results.get('price_analysis', {}).get('mean', 0), 2),
+            'avg_rating': round(
+                analysis_results.get('rating_analysis', {}).get('mean', 0), 2),
+            'total_reviews': analysis_results.get(
+                'review_analysis', {}).get('total', 0),
+            'avg_sentiment': title_analysis.get('avg_sentiment', 0),
+        },
+        'price_chart': create_price_chart(analysis_results),
+        'rating_chart': create_rating_chart(analysis_results),
+        'review_chart': create_review_chart(analysis_results),
+        'sentiment_chart': create_sentiment_chart(analysis_results),
+        'correlation_chart': create_correlation_chart(analysis_results),
+    }
+
+
+def create_price_chart(analysis_results):
+    """Bar chart of the price-range histogram."""
+    price_ranges = analysis_results.get('price_ranges', {})
+    fig = go.Figure(go.Bar(
+        x=list(price_ranges.keys()),
+        y=list(price_ranges.values()),
+        marker_color='#2c7fb8',
+    ))
+    fig.update_layout(title='Price Distribution', xaxis_title='Price Range',
+                      yaxis_title='Products', template='plotly_white')
+    return _to_json(fig)
+
+
+def create_rating_chart(analysis_results):
+    """Bar chart of half-star rating counts."""
+    distribution = analysis_results.get('rating_distribution', {})
+    fig = go.Figure(go.Bar(
+        x=list(distribution.keys()),
+        y=list(distribution.values()),
+        marker_color='#fdae61',
+    ))
+    fig.update_layout(title='Rating Distribution', xaxis_title='Stars',
+                      yaxis_title='Products', template='plotly_white')
+    return _to_json(fig)
+
+
+def create_review_chart(analysis_results):
+    """Bar chart of the review-count histogram."""
+    distribution = analysis_results.get('review_distribution', {})
+    fig = go.Figure(go.Bar(
+        x=list(distribution.keys()),
+        y=list(distribution.values()),
+        marker_color='#66c2a5',
+    ))
+    fig.update_layout(title='Review Count Distribution',
+                      xaxis_title='Reviews', yaxis_title='Products',
+                      template='plotly_white')
+    return _to_json(fig)
+
+
+def create_sentiment_chart(analysis_results):
+    """Pie chart of positive/neutral/negative title sentiment."""
+    title_analysis = analysis_results.get('title_analysis', {})
+    fig = go.Figure(go.Pie(
+        labels=['Positive', 'Neutral', 'Negative'],
+        values=[title_analysis.get('positive_count', 0),
+                title_analysis.get('neutral_count', 0),
+                title_analysis.get('negative_count', 0)],
+        marker_colors=['#1a9850', '#cccccc', '#d73027'],
+        hole=0.4,
+    ))
+    fig.update_layout(title='Title Sentiment', template='plotly_white')
+    return _to_json(fig)
+
+
+def create_correlation_chart(analysis_results):
+    """Heatmap of the price/rating/review correlation matrix."""
+    correlations = analysis_results.get('correlations', {})
+    labels = ['Price', 'Rating', 'Reviews']
+    corr_matrix = [
+        [1.0,
+         correlations.get('price_vs_rating', 0),
+         correlations.get('price_vs_reviews', 0)],
+        [correlations.get('price_vs_rating', 0),
+         1.0,
+         correlations.get('rating_vs_reviews', 0)],
+        [correlations.get('price_vs_reviews', 0),
+         correlations.get('rating_vs_reviews', 0),
+         1.0],
+    ]
+    z = np.nan_to_num(np.asarray(corr_matrix, dtype=np.float32))
+    text = np.round(z, 2)
+    fig = go.Figure(go.Heatmap(
+        z=z, x=labels, y=labels, text=text,
+        texttemplate='%{text}', colorscale='RdBu', zmin=-1, zmax=1,
+    ))
+    fig.update_layout(title='Correlations', template='plotly_white')
+    return _to_json(fig)
@@ -0,0 +1,203 @@
+"""Scraper for Amazon search result pages.
+
+Fetches pages concurrently over plain HTTP (httpx + selectolax) when
+those packages are installed, falling back to driving a headless Chrome
+through Selenium otherwise.
+"""
+
+import asyncio
+import re
+import time
+
+import pandas as pd
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional fast path; Selenium is the fallback.
+    httpx = None
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# Matches the ASIN in both plain and URL-encoded product links.
+_ASIN_RE = re.compile(r'(?:/dp/|dp%2F)([A-Z0-9]{10})')
+
+# Collects every product field for a results page in one round-trip to
+# the browser instead of several find_element calls per product.
+_JS_EXTRACT = """
+const text = (el, sel) => {
+  const node = el.querySelector(sel);
+  return node ? node.textContent.trim() : '';
+};
+return Array.from(document.querySelectorAll(
+    "div.s-result-item[data-component-type='s-search-result']")
+).map((el) => {
+  const link = el.querySelector('h2 a');
+  return {
+    title: text(el, 'h2 a span') || text(el, 'h2 span'),
+    url: link ? (link.href || '') : '',
+    price: text(el, 'span.a-price span.a-offscreen')
+        || text(el, 'span.a-price-whole'),
+    rating: text(el, 'span.a-icon-alt'),
+    review_count: text(el, 'span.a-size-base.s-underline-text'),
+  };
+});
+"""
+
+
+_driver_path = None
+
+
+def _chromedriver_path():
+    """Resolve (and cache) the chromedriver binary for this process.
+
+    ChromeDriverManager().install() re-checks versions on disk/network
+    every call; one lookup per process is enough.
+    """
+    global _driver_path
+    if _driver_path is None:
+        _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+class AmazonScraper:
+    """Scrapes Amazon search pages, by HTTP client or headless Chrome."""
+
+    BASE_URL = "https://www.amazon.com/s?k={query}&page={page}"
+
+    def __init__(self, headless=True):
+        self.headless = headless
+        self.driver = None
+
+    def setup_driver(self):
+        """Start a headless Chrome instance for scraping."""
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument(f"user-agent={USER_AGENT}")
+        service = Service(_chromedriver_path())
+        return webdriver.Chrome(service=service, options=options)
+
+    def _ensure_driver(self):
+        """Start Chrome on first use; later searches reuse the instance."""
+        if self.driver is None:
+            self.driver = self.setup_driver()
+        return self.driver
+
+    def close(self):
+        """Shut down the browser if one is running."""
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def search_amazon(self, search_term, max_pages=3, output_file=None,
+                      progress_callback=None):
+        """Scrape up to ``max_pages`` of results and optionally write a CSV.
+
+        Returns the scraped products as a DataFrame with columns
+        title/url/asin/price/rating/review_count.
+        """
+        urls = [self.BASE_URL.format(query=search_term.replace(' ', '+'),
+                                     page=page)
+                for page in range(1, max_pages + 1)]
+
+        if httpx is not None:
+            products = asyncio.run(self._fetch_and_parse(urls,
+                                                         progress_callback))
+        else:
+            products = self._search_selenium(urls, progress_callback)
+
+        df = pd.DataFrame(products)
+        if output_file:
+            if str(output_file).endswith('.parquet'):
+                # Columnar + snappy: the analyzer reads binary columns
+                # instead of re-tokenizing CSV text, at ~1/3 the bytes.
+                df.to_parquet(output_file, engine='pyarrow',
+                              compression='snappy')
+            else:
+                df.to_csv(output_file, index=False)
+        return df
+
+    async def _fetch_and_parse(self, urls, progress_callback=None):
+        """Fetch all result pages concurrently and parse them."""
+        async with httpx.AsyncClient(
+                http2=True, headers={'User-Agent': USER_AGENT},
+                follow_redirects=True, timeout=30.0) as client:
+            responses = await asyncio.gather(
+                *(client.get(url) for url in urls))
+
+        products = []
+        for i, response in enumerate(responses, start=1):
+            products.extend(self._parse_page(response.text))
+            if progress_callback:
+                progress_callback(int(i / len(urls) * 100))
+        return products
+
+    def _parse_page(self, html):
+        """Extract product fields from one results page with selectolax."""
+        results = []
+        tree = HTMLParser(html)
+        for node in tree.css(
+                "div.s-result-item[data-component-type='s-search-result']"):
+            product = {}
+
+            title_el = node.css_first("h2 a span") or node.css_first("h2 span")
+            product['title'] = (title_el.text().strip()
+                                if title_el else 'Unknown Product')
+
+            link_el = node.css_first("h2 a")
+            product['url'] = ((link_el.attributes.get('href') or '')
+                              if link_el else '')
+
+            match = _ASIN_RE.search(product['url'])
+            product['asin'] = match.group(1) if match else 'N/A'
+
+            price_el = (node.css_first("span.a-price span.a-offscreen")
+                        or node.css_first("span.a-price-whole"))
+            product['price'] = price_el.text().strip() if price_el else ''
+
+            rating_el = node.css_first("span.a-icon-alt")
+            product['rating'] = rating_el.text().strip() if rating_el else ''
+
+            reviews_el = node.css_first("span.a-size-base.s-underline-text")
+            product['review_count'] = (reviews_el.text().strip()
+                                       if reviews_el else '')
+
+            results.append(product)
+        return results
+
+    def _search_selenium(self, urls, progress_callback=None):
+        """Selenium fallback: fetch the result pages one at a time.
+
+        The driver stays open between searches; callers that are done
+        scraping release Chrome with :meth:`close`.
+        """
+        self._ensure_driver()
+        products = []
+        for i, url in enumerate(urls, start=1):
+            self.driver.get(url)
+            time.sleep(2)
+            products.extend(self.extract_products())
+            if progress_callback:
+                progress_callback(int(i / len(urls) * 100))
+        return products
+
+    def extract_products(self):
+        """Pull the product fields out of the current results page."""
+        results = []
+        for product in self.driver.execute_script(_JS_EXTRACT):
+            product['title'] = product['title'] or 'Unknown Product'
+
+            match = _ASIN_RE.search(product['url'])
+            product['asin'] = match.group(1) if match else 'N/A'
+
+            results.append(product)
+        return results
@@ -0,0 +1,276 @@
+"""Client for the Serper.dev Google Search API.
+
+Powers the "web insights" and product comparison views by pulling general
+search results, reviews and news for a product and boiling them down to a
+sentiment overview.
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter, Retry
+
+from utils import json_fast
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; the requests pool is the fallback.
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; full parsing is the fallback.
+    ijson = None
+
+# Sentiment vocabularies as frozensets: the result text is tokenized
+# once and each token is an O(1) membership check against both classes.
+POSITIVE_WORDS: frozenset = frozenset({
+    "great", "best", "amazing", "excellent", "love", "perfect", "awesome",
+    "fantastic", "good", "impressive", "recommended", "outstanding",
+    "superb", "solid", "reliable", "worth", "superior",
+})
+NEGATIVE_WORDS: frozenset = frozenset({
+    "bad", "worst", "terrible", "awful", "poor", "disappointing", "broken",
+    "fails", "issue", "problem", "defective", "refund", "avoid",
+    "cheap", "flimsy", "worse",
+})
+
+class SerperAPI:
+    """Thin wrapper around the Serper.dev search endpoints."""
+
+    BASE_URL = "https://google.serper.dev/"
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.headers = {
+            "X-API-KEY": api_key,
+            "Content-Type": "application/json",
+        }
+        # Insights and comparisons repeat queries (a compared product is
+        # searched for general/review/news again); a short TTL dedupes
+        # those POSTs without serving stale results for long.
+        self._search_cache = TTLCache(maxsize=256, ttl=300)
+        self._cache_lock = threading.Lock()
+        # One pooled client per instance: keep-alive spares the TLS
+        # handshake on every query after the first. httpx adds HTTP/2,
+        # so the concurrent insight searches multiplex over a single
+        # connection instead of three.
+        if httpx is not None:
+            self._session = None
+            self._client = httpx.Client(
+                base_url=self.BASE_URL, headers=self.headers, http2=True,
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                limits=httpx.Limits(max_keepalive_connections=4))
+        else:
+            self._client = None
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            self._session.mount("https://", HTTPAdapter(
+                pool_connections=4, pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2,
+                                  status_forcelist=(429, 500, 502, 503, 504))))
+
+    def close(self):
+        """Release the pooled connections."""
+        if self._client is not None:
+            self._client.close()
+        else:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def search(self, query, search_type="search", num_results=10):
+        """Run a single Serper query and return the parsed JSON response."""
+        key = (query, search_type, num_results)
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        payload = {"q": query, "num": num_results}
+        if self._client is not None:
+            response = self._client.post(search_type, json=payload)
+        else:
+            response = self._session.post(
+                f"{self.BASE_URL}{search_type}",
+                json=payload,
+                timeout=(3.05, 10),
+            )
+        response.raise_for_status()
+        # json_fast skips the client's charset sniffing and uses the
+        # quickest installed decoder.
+        result = json_fast.loads(response.content)
+        with self._cache_lock:
+            self._search_cache[key] = result
+        return result
+
+    def search_stream(self, query, search_type="search", num_results=10,
+                      prefix="organic.item"):
+        """Yield only the result items under ``prefix`` from a query.
+
+        For callers that consume a handful of rows (top-5 summaries),
+        ijson parses the listed subtree incrementally off the wire and
+        never materializes the rest of the response (knowledge panels,
+        related searches, ads). Falls back to a full search() when
+        ijson is missing or the httpx client is active, since httpx
+        reads multiplexed responses eagerly.
+        """
+        if ijson is None or self._session is None:
+            data = self.search(query, search_type=search_type,
+                               num_results=num_results)
+            yield from data.get(prefix.split('.', 1)[0], [])
+            return
+
+        response = self._session.post(
+            f"{self.BASE_URL}{search_type}",
+            json={"q": query, "num": num_results},
+            timeout=(3.05, 10),
+            stream=True,
+        )
+        response.raise_for_status()
+        # urllib3 hands back the raw socket stream; without this flag a
+        # gzip-encoded body (Serper compresses JSON) reaches ijson as
+        # compressed bytes and fails to parse.
+        response.raw.decode_content = True
+        try:
+            yield from ijson.items(response.raw, prefix)
+        finally:
+            response.close()
+
+    def get_product_insights(self, product_name, num_results=10):
+        """Collect general, review and news results for one product.
+
+        The three queries are independent, so they run concurrently on
+        the pooled session and the call takes one round-trip's latency
+        instead of three.
+        """
+        queries = {
+            "general": (product_name, "search"),
+            "reviews": (f"{product_name} review", "search"),
+            "news": (f"{product_name} news", "news"),
+        }
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {
+                key: executor.submit(self.search, query,
+                                     search_type=search_type,
+                                     num_results=num_results)
+                for key, (query, search_type) in queries.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def compare_products(self, product1, product2, num_results=20):
+        """Fetch and format insights for two products side by side."""
+        return {
+            "product1": {
+                "name": product1,
+                "insights": format_insights(
+                    self.get_product_insights(product1, num_results)),
+            },
+            "product2": {
+                "name": product2,
+                "insights": format_insights(
+                    self.get_product_insights(product2, num_results)),
+            },
+        }
+
+    @staticmethod
+    def extract_sentiment_keywords(search_results,
+                                   fields=("source", "title", "snippet",
+                                           "sentiment")):
+        """Classify each organic result as positive, negative or neutral.
+
+        With ``fields=("sentiment",)`` the per-result dicts are skipped
+        and the list holds just the sentiment labels — callers tallying
+        an overview don't pay for source/title/snippet they discard.
+        """
+        sentiments_only = fields == ("sentiment",)
+        keywords = []
+        for result in search_results.get("organic", []):
+            title = result.get("title", "")
+            snippet = result.get("snippet", "")
+            text = (title + " " + snippet).lower()
+
+            # News rows often carry no snippet; skip the tokenization
+            # for text that is empty bar the joining space.
+            if text.isspace():
+                sentiment = "neutral"
+            else:
+                # Counter hashes the tokens in C; the Python-level loop
+                # then only runs over the small vocabularies.
+                counts = Counter(text.split())
+                pos_count = sum(counts[w] for w in POSITIVE_WORDS
+                                if w in counts)
+                neg_count = sum(counts[w] for w in NEGATIVE_WORDS
+                                if w in counts)
+                if pos_count > neg_count:
+                    sentiment = "positive"
+                elif neg_count > pos_count:
+                    sentiment = "negative"
+                else:
+                    sentiment = "neutral"
+
+            if sentiments_only:
+                keywords.append(sentiment)
+            else:
+                keywords.append({
+                    "source": urlsplit(result.get("link", "")).netloc,
+                    "title": title,
+                    "snippet": snippet,
+                    "sentiment": sentiment,
+                })
+        return keywords
+
+
+def format_insights(insights):
+    """Reduce raw Serper responses to the fields the templates render."""
+    formatted = {
+        "summary": [],
+        "sentiment_overview": {"positive": 0, "negative": 0, "neutral": 0},
+        "recent_news": [],
+        "top_sources": [],
+    }
+
+    if "general" in insights:
+        organic = insights["general"].get("organic", [])
+        formatted["summary"] = [
+            {
+                "title": result.get("title", ""),
+                "snippet": result.get("snippet", ""),
+                "link": result.get("link", ""),
+            }
+            for result in organic[:5]
+        ]
+        formatted["top_sources"] = [
+            {
+                "source": urlsplit(result.get("link", "")).netloc,
+                "title": result.get("title", ""),
+            }
+            for result in organic[:5]
+        ]
+
+    if "reviews" in insights:
+        sentiments = SerperAPI.extract_sentiment_keywords(
+            insights["reviews"], fields=("sentiment",))
+        for sentiment in sentiments:
+            formatted["sentiment_overview"][sentiment] += 1
+
+    if "news" in insights:
+        formatted["recent_news"] = [
+            {
+                "title": item.get("title", ""),
+                "snippet": item.get("snippet", ""),
+                "link": item.get("link", ""),
+                "date": item.get("date", ""),
+            }
+            for item in insights["news"].get("news", [])[:5]
+        ]
+
+    return formatted
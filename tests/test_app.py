@@ -0,0 +1,98 @@
+"""Exercises the web app's search -> status -> dashboard flow.
+
+The scrape+analyze phase is patched out with a stub that writes a small
+analysis file, so the job pipeline and its routes run through Flask's
+test client without Chrome, network access or a broker.
+"""
+
+import os
+import re
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app as reviewscope
+
+_ANALYSIS = {
+    'total_products': 1,
+    'price_analysis': {'min': 9.99, 'max': 9.99, 'mean': 9.99,
+                       'median': 9.99, 'std': 0.0},
+    'rating_analysis': {'min': 4.5, 'max': 4.5, 'mean': 4.5,
+                        'median': 4.5, 'std': 0.0},
+    'review_analysis': {'min': 10, 'max': 10, 'mean': 10.0,
+                        'median': 10.0, 'total': 10},
+    'correlations': {'price_vs_rating': 0.0, 'price_vs_reviews': 0.0,
+                     'rating_vs_reviews': 0.0},
+    'price_ranges': {'$0-25': 1},
+    'rating_distribution': {'4.5': 1},
+    'review_distribution': {'0-10': 1},
+    'title_analysis': {'top_words': [{'word': 'widget', 'count': 1}],
+                       'avg_sentiment': 0.0, 'positive_count': 0,
+                       'neutral_count': 1, 'negative_count': 0},
+}
+
+
+def _fake_execute(job_id, search_term, max_pages, report):
+    report(50, status='analyzing')
+    reviewscope.result_path(job_id).write_bytes(
+        reviewscope.orjson.dumps(_ANALYSIS))
+    slug = search_term.translate(reviewscope._SLUG)
+    return {
+        'job_id': job_id,
+        'search_term': search_term,
+        'status': 'completed',
+        'progress': 100,
+        'dashboard_url': f"/dashboard/{job_id}",
+        'data_file': str(reviewscope.data_path(job_id)),
+        'result_file': str(reviewscope.result_path(job_id)),
+        'data_download_name': f"amazon_products_{slug}.csv",
+        'analysis_download_name': f"amazon_analysis_{slug}.json",
+    }
+
+
+def _wait_for_job(client, job_id, deadline=5.0):
+    end = time.time() + deadline
+    job = None
+    while time.time() < end:
+        job = client.get(f'/api/job-status/{job_id}').get_json()
+        if job and job.get('status') in ('completed', 'failed'):
+            return job
+        time.sleep(0.05)
+    return job
+
+
+def test_search_status_dashboard_flow():
+    client = reviewscope.app.test_client()
+    job_id = None
+    try:
+        with patch.object(reviewscope, '_execute_scraper_job',
+                          side_effect=_fake_execute):
+            resp = client.post('/search', data={'search_term': 'test widget',
+                                                'max_pages': '1'})
+            assert resp.status_code == 200
+            match = re.search(r'"(test_widget_[0-9a-f]{8})"',
+                              resp.get_data(as_text=True))
+            assert match, 'job id missing from results page'
+            job_id = match.group(1)
+
+            job = _wait_for_job(client, job_id)
+            assert job is not None
+            assert job['status'] == 'completed', job.get('error')
+            assert job['job_id'] == job_id
+            assert job['progress'] == 100
+
+            resp = client.get(job['dashboard_url'])
+            assert resp.status_code == 200
+    finally:
+        if job_id:
+            for path in (reviewscope.result_path(job_id),
+                         reviewscope.RESULTS / f"{job_id}_dashboard.json.gz"):
+                if path.exists():
+                    path.unlink()
+
+
+if __name__ == '__main__':
+    test_search_status_dashboard_flow()
+    print('search flow: ok')
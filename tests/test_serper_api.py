@@ -0,0 +1,109 @@
+"""Exercises the Serper client against canned fixture responses.
+
+Run directly (``python tests/test_serper_api.py``) or via pytest.
+``SerperAPI.search`` is patched to serve the JSON payloads under
+``tests/fixtures``, so no network, quota or real API key is involved
+and the parsing/formatting paths run deterministically. Set
+``SERPER_API_KEY`` to exercise a specific key value.
+"""
+
+import gzip
+import io
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modules import serper_api
+from modules.serper_api import SerperAPI, format_insights
+from utils import json_fast
+from utils.helper import save_json_file
+
+API_KEY = os.environ.get("SERPER_API_KEY", "test-key")
+TEST_QUERY = "MacBook Air M2"
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _fake_search(query, search_type="search", num_results=10):
+    name = ("serper_news.json" if search_type == "news"
+            else "serper_search.json")
+    return json_fast.loads((FIXTURES / name).read_bytes())
+
+
+def test_basic_search():
+    api = SerperAPI(API_KEY)
+    with patch.object(SerperAPI, "search", side_effect=_fake_search):
+        results = api.search(TEST_QUERY, num_results=5)
+    assert "organic" in results
+    assert len(results["organic"]) > 0
+
+
+def test_product_insights(tmp_path):
+    api = SerperAPI(API_KEY)
+    with patch.object(SerperAPI, "search", side_effect=_fake_search):
+        insights = api.get_product_insights(TEST_QUERY, num_results=5)
+    formatted = format_insights(insights)
+    save_json_file(formatted, str(tmp_path / "serper_test_results.json"))
+    assert formatted["summary"]
+    assert formatted["top_sources"][0]["source"] == "www.theverge.com"
+    assert formatted["recent_news"]
+    overview = formatted["sentiment_overview"]
+    assert sum(overview.values()) == 5
+    assert overview["positive"] >= 1
+    assert overview["negative"] >= 1
+
+
+class _FakeRaw:
+    """Mimics urllib3's raw stream: gzipped until decode_content is set."""
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.decode_content = False
+        self._stream = None
+
+    def read(self, size=-1):
+        if self._stream is None:
+            self._stream = io.BytesIO(
+                self._payload if self.decode_content
+                else gzip.compress(self._payload))
+        return self._stream.read(size)
+
+
+def test_search_stream_decodes_fixture():
+    if serper_api.ijson is None:
+        return  # optional dependency not installed; full-parse fallback applies
+    api = SerperAPI(API_KEY)
+    api._client = None  # force the streaming requests path
+    response = SimpleNamespace(
+        raw=_FakeRaw((FIXTURES / "serper_search.json").read_bytes()),
+        raise_for_status=lambda: None, close=lambda: None)
+    api._session = SimpleNamespace(post=lambda *args, **kwargs: response)
+
+    items = list(api.search_stream(TEST_QUERY, num_results=5))
+    assert len(items) == 5
+    assert items[0]["link"].startswith("https://www.theverge.com")
+
+
+def test_comparison():
+    api = SerperAPI(API_KEY)
+    with patch.object(SerperAPI, "search", side_effect=_fake_search):
+        comparison = api.compare_products(TEST_QUERY, "Dell XPS 13",
+                                          num_results=5)
+    assert comparison["product1"]["name"] == TEST_QUERY
+    assert "sentiment_overview" in comparison["product2"]["insights"]
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_basic_search()
+    print("basic search: ok")
+    test_product_insights(Path(tempfile.mkdtemp()))
+    print("product insights: ok")
+    test_comparison()
+    print("comparison: ok")
+    test_search_stream_decodes_fixture()
+    print("search stream: ok")
@@ -0,0 +1,43 @@
+"""Small shared helpers for JSON persistence and filename handling."""
+
+import os
+import re
+import string
+
+from utils import json_fast
+
+_FILENAME_RE = re.compile(r'[^\w\-.]')
+
+# Translation table mapping every disallowed ASCII character to '_';
+# one C-level scan instead of running the regex engine.
+_FILENAME_SAFE = set(string.ascii_letters + string.digits + '_-.')
+_FILENAME_TRANS = str.maketrans({c: '_' for c in map(chr, range(128))
+                                 if c not in _FILENAME_SAFE})
+
+
+def load_json_file(file_path):
+    """Load a JSON file and return its contents, or None if it doesn't exist."""
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, 'rb') as f:
+        return json_fast.loads(f.read())
+
+
+def save_json_file(data, file_path):
+    """Persist ``data`` as pretty-printed JSON at ``file_path``."""
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # The payload is one preformatted bytes object, so skip the
+    # BufferedWriter copy and hand it straight to the OS.
+    with open(file_path, 'wb', buffering=0) as f:
+        f.write(json_fast.dumps(data, indent=True))
+
+
+def clean_filename(filename):
+    """Replace characters that are unsafe in filenames with underscores."""
+    if filename.isascii():
+        return filename.translate(_FILENAME_TRANS)
+    # Non-ASCII names keep the regex path so \w's Unicode word
+    # characters survive as before.
+    return _FILENAME_RE.sub('_', filename)
@@ -0,0 +1,70 @@
+"""Fastest-available JSON codec for the project.
+
+Exposes ``loads``/``dumps`` backed by the quickest installed library —
+orjson, then rapidjson, then ujson, then stdlib json — so JSON-heavy
+paths get the speedup wherever one of the C/Rust codecs is available
+without every module repeating the fallback dance.
+
+``dumps`` always returns UTF-8 bytes; pass ``indent=True`` for
+2-space pretty printing.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+if orjson is not None:
+    BACKEND = 'orjson'
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj, indent=False):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+elif rapidjson is not None:
+    BACKEND = 'rapidjson'
+
+    def loads(data):
+        return rapidjson.loads(data)
+
+    def dumps(obj, indent=False):
+        return rapidjson.dumps(obj, indent=2 if indent else None,
+                               ensure_ascii=False).encode('utf-8')
+
+elif ujson is not None:
+    BACKEND = 'ujson'
+
+    def loads(data):
+        return ujson.loads(data)
+
+    def dumps(obj, indent=False):
+        return ujson.dumps(obj, indent=2 if indent else 0,
+                           ensure_ascii=False).encode('utf-8')
+
+else:
+    BACKEND = 'json'
+
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None,
+                          ensure_ascii=False).encode('utf-8')